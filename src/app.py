@@ -1,82 +1,397 @@
+import numpy as np
 import pandas as pd
 from dash import Dash, html, dcc, dash_table, Input, Output
-import plotly.express as px
+from dash.dash_table.Format import Format, Scheme
+import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
+import pyarrow.csv
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import io
 import logging
+import os
+import re
 import sys
+import warnings
 
-# Configure logging
+# Configure logging; set LOG_LEVEL=DEBUG to trace data loading
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name%s - %(levelname)s - %(message)s',
+    level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     stream=sys.stdout
 )
 logger = logging.getLogger(__name__)
 
-try:
-    # Initialize the Dash app with external stylesheets
-    app = Dash(__name__, suppress_callback_exceptions=True)
+# Dash serializes layouts and callback responses through plotly's JSON encoder;
+# orjson is several times faster than the stdlib json fallback
+pio.json.config.default_engine = 'orjson'
+
+# Columns to convert to numeric types and summarise per industry group
+columns_to_convert = [
+    'First Financing Size', 'First Financing Valuation',
+    'Revenue', 'Revenue Growth %', 'Net Income', 'Net Debt', 'Market Cap',
+    'Gross Profit', 'Enterprise Value', 'EBITDA', 'EBIT',
+    'Total Patent Document', 'Total Clinical Trials', '#Active Investors'
+]
+
+# Columns sent to the browser in the company data table
+DISPLAY_COLS = ['Company', 'Primary Industry Group', *columns_to_convert]
+
+# Columns read from the CSV; everything else is never used by the dashboard
+needed_columns = DISPLAY_COLS
+
+# Bump when the contents of the cached frames change
+CACHE_VERSION = 9
+
+# DataTable filter operators, mapped to the pandas Series method they apply
+FILTER_OPERATORS = {
+    '>=': 'ge', '<=': 'le', '!=': 'ne', '<': 'lt', '>': 'gt', '=': 'eq',
+    'ge': 'ge', 'le': 'le', 'ne': 'ne', 'lt': 'lt', 'gt': 'gt', 'eq': 'eq',
+    'contains': 'contains', 'datestartswith': 'datestartswith', 'is blank': 'is blank'
+}
+
+# One filter expression: '{column}', then an operator with an optional case prefix
+# ('i' insensitive, 's' sensitive) anchored right after it, then the value.
+# Longer symbols come first so that e.g. '>=' is matched before '>'.
+FILTER_PATTERN = re.compile(
+    r"^\s*\{(?P<column>[^}]*)\}\s*"
+    r"(?:(?P<case>[is])?(?P<symbol>>=|<=|!=|<|>|=)"
+    r"|(?P<case_word>[is])?(?P<word>ge|le|ne|lt|gt|eq|contains|datestartswith)(?=\s|$)"
+    r"|(?P<unary>is blank)\s*$)"
+    r"\s*(?P<value>.*?)\s*$"
+)
+
+# Analysis columns are stored as float32, so show them to float32 precision
+FLOAT_FORMAT = Format(precision=7, scheme=Scheme.decimal_or_exponent)
+
+
+def load_data(data_path):
+    """Read the CSV and coerce the analysis columns to numeric types."""
+    try:
+        # Parse only the needed columns with the multi-threaded Arrow reader,
+        # reading the analysis columns as floats directly
+        df_top = pd.read_csv(
+            data_path,
+            engine='pyarrow',
+            usecols=needed_columns,
+            dtype={col: 'float64' for col in columns_to_convert}
+        )
+    except ValueError:
+        # Some values are not numeric; convert the columns in parallel, coercing errors to NaN
+        logger.warning("Non-numeric values found in analysis columns, coercing to NaN")
+        df_top = pd.read_csv(data_path, engine='pyarrow', usecols=needed_columns)
+        with ThreadPoolExecutor(max_workers=min(len(columns_to_convert), os.cpu_count() or 1)) as executor:
+            converted = executor.map(
+                functools.partial(pd.to_numeric, errors='coerce'),
+                (df_top[col] for col in columns_to_convert)
+            )
+            df_top[columns_to_convert] = pd.concat(converted, axis=1)
+
+    # The Arrow reader keeps blank text cells as '' where the C engine gives NaN
+    text_columns = ['Company', 'Primary Industry Group']
+    df_top[text_columns] = df_top[text_columns].replace('', np.nan)
+
+    # Compact dtypes: halve the metric columns and group on integer category codes
+    df_top[columns_to_convert] = df_top[columns_to_convert].astype('float32')
+    df_top['Primary Industry Group'] = df_top['Primary Industry Group'].astype('category')
+
+    # Sort once so each industry group is a contiguous block of rows
+    df_top = df_top.sort_values('Primary Industry Group', kind='stable').reset_index(drop=True)
+
+    return df_top
+
+
+def split_filter_part(filter_part):
+    """Split one DataTable filter expression into ``(column, operator, value, ignore_case)``.
+
+    ``value`` is the raw text with any quotes removed; it is converted to the
+    column's type when the filter is applied.
+    """
+    match = FILTER_PATTERN.match(filter_part)
+    if not match:
+        return None, None, None, False
+
+    operator = match.group('symbol') or match.group('word') or match.group('unary')
+    value = match.group('value')
+    if value and value[0] == value[-1] and value[0] in ("'", '"', '`') and len(value) > 1:
+        value = value[1:-1].replace('\\' + value[0], value[0])
+    ignore_case = (match.group('case') or match.group('case_word')) == 'i'
+
+    return match.group('column'), FILTER_OPERATORS[operator], value, ignore_case
+
+
+def filter_data(df, filter_query):
+    """Apply a DataTable ``filter_query`` to ``df``, skipping expressions that do not apply."""
+    if not filter_query:
+        return df
+
+    for filter_part in filter_query.split(' && '):
+        col_name, operator, filter_value, ignore_case = split_filter_part(filter_part)
+        if col_name not in df.columns:
+            continue
 
-    # For web deployment
-    server = app.server
+        column = df[col_name]
+        try:
+            if operator == 'is blank':
+                mask = column.isna() | (column.astype('string') == '')
+            elif operator in ('eq', 'ne', 'lt', 'le', 'gt', 'ge') and pd.api.types.is_numeric_dtype(column):
+                # These operators match pandas Series method names
+                mask = getattr(column, operator)(float(filter_value))
+            else:
+                # Compare text (including the categorical industry group) as strings
+                text = column.astype('string')
+                if ignore_case:
+                    text, filter_value = text.str.lower(), filter_value.lower()
+                if operator == 'contains':
+                    mask = text.str.contains(filter_value, regex=False)
+                elif operator == 'datestartswith':
+                    mask = text.str.startswith(filter_value)
+                else:
+                    mask = getattr(text, operator)(filter_value)
+        except (TypeError, ValueError):
+            logger.debug("Ignoring filter expression: %s", filter_part)
+            continue
 
-    # Read the data
-    import os
-    import sys
+        df = df.loc[mask.fillna(False).astype(bool)]
+
+    return df
+
+
+def round_significant(series, digits=7):
+    """Round ``series`` to ``digits`` significant digits."""
+    return series.map(lambda value: float(f'{value:.{digits}g}'))
+
+
+def to_records(df):
+    """Convert ``df`` to a list of row dicts, column by column in Arrow."""
+    return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+
+
+def column_spec(name, dtype):
+    """Return the DataTable column definition for a column of ``dtype``."""
+    if pd.api.types.is_float_dtype(dtype):
+        return {"name": name, "id": name, "type": "numeric", "format": FLOAT_FORMAT}
+    return {"name": name, "id": name}
+
+
+def group_stats(values, starts):
+    """Calculate mean, median, std and count of one column for contiguous row blocks.
+
+    ``values`` is a 1-D array sorted by group and ``starts`` holds the first
+    row of each non-empty group, so every row belongs to exactly one block.
+    NaNs are ignored, as in pandas. Returns a dict of ``(n_groups,)`` arrays.
+    Temporaries are column-sized and reused in place, and sums accumulate in float64.
+    """
+    sizes = np.diff(np.append(starts, len(values)))
+    valid = ~np.isnan(values)
+
+    # Sum every block at once; std uses a second pass over deviations for accuracy
+    count = np.add.reduceat(valid, starts, dtype=np.int64)
+    work = np.where(valid, values, 0)
+    total = np.add.reduceat(work, starts, dtype=np.float64)
+
+    with warnings.catch_warnings():
+        # All-NaN columns and single-value std are expected to give NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = total / np.where(count > 0, count, np.nan)
+
+        work -= np.repeat(mean.astype(work.dtype), sizes)
+        work[~valid] = 0
+        np.square(work, out=work)
+        std = np.sqrt(np.add.reduceat(work, starts, dtype=np.float64) / np.where(count > 1, count - 1, np.nan))
+
+        # Medians need the order statistics of each block; nanmedian partitions each slice
+        median = np.array([np.nanmedian(block.astype(np.float64)) for block in np.split(values, starts[1:])])
+
+    return {'mean': mean, 'median': median, 'std': std, 'count': count}
+
+
+def build_grouped(df_top):
+    """Calculate descriptive statistics per 'Primary Industry Group'."""
+    # Rows are sorted by group code (missing groups last), so each group is one block
+    group_keys = df_top['Primary Industry Group']
+    codes = group_keys.cat.codes.to_numpy()
+    sizes = np.bincount(codes[codes >= 0], minlength=len(group_keys.cat.categories))
+    observed = sizes > 0
+    starts = (np.cumsum(sizes) - sizes)[observed]
+
+    # One column at a time, so only a single column's temporaries are alive at once
+    n_rows = sizes.sum()
+    stats = {col: group_stats(df_top[col].to_numpy()[:n_rows], starts) for col in columns_to_convert}
+
+    # Build the frame once with its final flattened column names (adjusted for
+    # Dash DataTable), in the same order as .agg(['mean', 'median', 'std', 'count'])
+    grouped = pd.DataFrame(
+        {
+            f'{col}_{name}'.strip().replace(' ', '_').replace('(', '').replace(')', ''): stat
+            for col in columns_to_convert
+            for name, stat in stats[col].items()
+        },
+        index=pd.CategoricalIndex(
+            group_keys.cat.categories[observed], dtype=group_keys.dtype, name='Primary Industry Group'
+        )
+    )
+
+    return grouped
+
+
+def build_box_stats(df_top):
+    """Calculate box plot statistics and outliers per 'Primary Industry Group' and variable.
+
+    Quartiles use pandas' linear interpolation and the fences are the most
+    extreme values within 1.5 IQR of the box, matching plotly's own whiskers.
+    Returns ``box_stats`` and ``box_outliers``, one row per point outside the fences.
+    """
+    # Rows without a group have no box; they must not be fenced or drawn as outliers
+    df_top = df_top[df_top['Primary Industry Group'].notna()]
+    group_keys = df_top['Primary Industry Group']
+    values = df_top[columns_to_convert]
+    groups = values.groupby(group_keys, sort=False, observed=True)
+
+    # Quartiles broadcast back to the rows, to find the points inside the fences
+    q1 = groups.transform('quantile', 0.25)
+    q3 = groups.transform('quantile', 0.75)
+    iqr = q3 - q1
+    inside = values.where((values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr))
+    inside_groups = inside.groupby(group_keys, sort=False, observed=True)
+
+    stats = {
+        'q1': groups.quantile(0.25),
+        'median': groups.median(),
+        'q3': groups.quantile(0.75),
+        'lowerfence': inside_groups.min(),
+        'upperfence': inside_groups.max(),
+        'mean': groups.mean(),
+    }
+    box_stats = pd.concat({name: stat.stack(dropna=False) for name, stat in stats.items()}, axis=1)
+    box_stats.index.names = ['Primary Industry Group', 'variable']
+
+    # Points beyond the fences are drawn individually; one column at a time keeps this O(outliers)
+    box_outliers = pd.concat(
+        [
+            pd.DataFrame({
+                'Primary Industry Group': group_keys[is_outlier],
+                'Company': df_top['Company'][is_outlier],
+                'variable': col,
+                'value': values[col][is_outlier],
+            })
+            for col in columns_to_convert
+            for is_outlier in [values[col].notna() & inside[col].isna()]
+        ],
+        ignore_index=True
+    )
+
+    return box_stats, box_outliers
+
+
+def write_feather(df, path):
+    """Write ``df`` to ``path`` atomically, so readers never see a partial file."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        df.to_feather(tmp_path, compression='lz4')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_or_build_cache(data_path):
+    """Load ``df_top``, ``grouped``, ``box_stats`` and ``box_outliers`` from the Feather sidecar cache.
+
+    The cache files live next to the CSV and are keyed on its mtime, so editing
+    the CSV invalidates them. On a miss the data is recomputed and the cache
+    rewritten; failing to write it (e.g. read-only filesystem) is not fatal.
+    """
+    data_dir = os.path.dirname(data_path)
+    cache_key = hashlib.md5(f"{CACHE_VERSION}:{os.path.getmtime(data_path)}".encode()).hexdigest()[:12]
+    df_cache_path = os.path.join(data_dir, f'df_top.{cache_key}.cache.feather')
+    grouped_cache_path = os.path.join(data_dir, f'grouped.{cache_key}.cache.feather')
+    box_stats_cache_path = os.path.join(data_dir, f'box_stats.{cache_key}.cache.feather')
+    box_outliers_cache_path = os.path.join(data_dir, f'box_outliers.{cache_key}.cache.feather')
+    cache_paths = [df_cache_path, grouped_cache_path, box_stats_cache_path, box_outliers_cache_path]
+
+    if all(os.path.exists(path) for path in cache_paths):
+        logger.info("Loading cached data from: %s", data_dir)
+        try:
+            df_top = pd.read_feather(df_cache_path)
+            grouped = pd.read_feather(grouped_cache_path).set_index('Primary Industry Group')
+            box_stats = pd.read_feather(box_stats_cache_path).set_index(['Primary Industry Group', 'variable'])
+            box_outliers = pd.read_feather(box_outliers_cache_path)
+            return df_top, grouped, box_stats, box_outliers
+        except (OSError, ValueError, KeyError) as e:
+            # A damaged cache is rebuilt below rather than failing startup
+            logger.warning("Could not read data cache, rebuilding: %s", e)
+
+    df_top = load_data(data_path)
+    grouped = build_grouped(df_top)
+    box_stats, box_outliers = build_box_stats(df_top)
+
+    try:
+        # Drop caches left behind by previous versions of the CSV
+        for name in os.listdir(data_dir):
+            if '.cache.feather' in name:
+                os.remove(os.path.join(data_dir, name))
+        write_feather(df_top, df_cache_path)
+        write_feather(grouped.reset_index(), grouped_cache_path)
+        write_feather(box_stats.reset_index(), box_stats_cache_path)
+        write_feather(box_outliers, box_outliers_cache_path)
+        logger.info("Wrote data cache to: %s", data_dir)
+    except OSError as e:
+        logger.warning("Could not write data cache: %s", e)
+
+    return df_top, grouped, box_stats, box_outliers
+
+
+def create_app():
+    """Load the data, build the layout and register the callbacks.
+
+    Everything runs here rather than at import so that gunicorn ``--preload``
+    builds the read-only DataFrames once in the master process and the
+    workers share them through fork copy-on-write.
+    """
+    # Initialize the Dash app with external stylesheets
+    app = Dash(__name__, suppress_callback_exceptions=True)
 
     # Get the absolute path to the data file
     current_dir = os.path.dirname(os.path.abspath(__file__))
     data_path = os.path.join(current_dir, 'data', 'df_top.csv')
 
     try:
-        logger.info(f"Current working directory: {os.getcwd()}")
-        logger.info(f"__file__ location: {__file__}")
-        logger.info(f"Attempting to load data from: {data_path}")
+        logger.info("Current working directory: %s", os.getcwd())
+        logger.info("__file__ location: %s", __file__)
+        logger.info("Attempting to load data from: %s", data_path)
         
         # List the contents of the directory where the file should be
         data_dir = os.path.dirname(data_path)
-        if os.path.exists(data_dir):
-            logger.info(f"Contents of {data_dir}:")
-            logger.info(str(os.listdir(data_dir)))
-        else:
-            logger.error(f"Data directory does not exist: {data_dir}")
+        if not os.path.exists(data_dir):
+            logger.error("Data directory does not exist: %s", data_dir)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Contents of %s: %s", data_dir, os.listdir(data_dir))
         
         # Try to read the file
         if os.path.exists(data_path):
-            df_top = pd.read_csv(data_path)
+            df_top, grouped, box_stats, box_outliers = get_or_build_cache(data_path)
             logger.info("Successfully loaded the data file")
         else:
             raise FileNotFoundError(f"Data file not found at: {data_path}")
 
     except Exception as e:
-        logger.error(f"Error loading data: {str(e)}")
-        logger.error(f"Stack trace:", exc_info=True)
+        logger.error("Error loading data: %s", e)
+        logger.error("Stack trace:", exc_info=True)
         raise
 
-    # Convert relevant columns to numeric types, coerce errors to NaN
-    columns_to_convert = [
-        'First Financing Size', 'First Financing Valuation',
-        'Revenue', 'Revenue Growth %', 'Net Income', 'Net Debt', 'Market Cap',
-        'Gross Profit', 'Enterprise Value', 'EBITDA', 'EBIT',
-        'Total Patent Document', 'Total Clinical Trials', '#Active Investors'
-    ]
-
-    for col in columns_to_convert:
-        df_top[col] = pd.to_numeric(df_top[col], errors='coerce')
-
-    # Group data by 'Primary Industry Group' and calculate descriptive statistics
-    grouped = df_top.groupby('Primary Industry Group')[columns_to_convert].agg(['mean', 'median', 'std', 'count'])
+    logger.debug("Grouped DataFrame:\n%s", grouped.head())
 
-    # Flatten the multi-level column names in the grouped DataFrame
-    grouped.columns = ['_'.join(col).strip() for col in grouped.columns]
+    # Flatten the statistics once for the table, its records and the CSV download
+    grouped_flat = grouped.reset_index()
 
-    # Adjust column names for compatibility with Dash DataTable
-    grouped.columns = [col.replace(' ', '_').replace('(', '').replace(')', '') for col in grouped.columns]
-
-    print("Grouped DataFrame:")
-    print(grouped.head())
-
-    print("Grouped DataFrame after flattening and adjustments:")
-    print(grouped.head())
+    # The inputs are float32, so round away float32 noise (e.g. 14.329999923706055) for export
+    float_columns = grouped_flat.select_dtypes('float').columns
+    grouped_flat[float_columns] = grouped_flat[float_columns].apply(round_significant)
+    grouped_table = pa.Table.from_pandas(grouped_flat, preserve_index=False)
+    grouped_records = grouped_table.to_pylist()
 
     app.layout = html.Div([
         html.H1("Analysis Dashboard", style={
@@ -130,8 +445,8 @@ try:
             }),
             dash_table.DataTable(
                 id='descriptive-stats-table',
-                columns=[{"name": col, "id": col} for col in grouped.reset_index().columns],
-                data=grouped.reset_index().to_dict('records'),
+                columns=[column_spec(col, dtype) for col, dtype in grouped_flat.dtypes.items()],
+                data=grouped_records,
                 style_table={'overflowX': 'auto'},
                 style_cell={
                     'minWidth': '150px', 'width': '200px', 'maxWidth': '300px',
@@ -181,9 +496,10 @@ try:
             }),
             dash_table.DataTable(
                 id='data-table',
-                columns=[{"name": i, "id": i} for i in df_top.columns],
-                data=df_top.to_dict('records'),
+                columns=[column_spec(i, dtype) for i, dtype in df_top.dtypes[DISPLAY_COLS].items()],
+                page_current=0,
                 page_size=10,
+                page_action='custom',
                 style_table={'overflowX': 'auto'},
                 style_cell={
                     'minWidth': '100px', 'width': '150px', 'maxWidth': '200px',
@@ -211,7 +527,9 @@ try:
                     'border': '1px solid #ccc',
                     'border-radius': '5px'
                 },
-                sort_action='native',
+                sort_action='custom',
+                sort_mode='single',
+                sort_by=[],
                 row_selectable='multi',
                 selected_rows=[],
             )
@@ -228,45 +546,103 @@ try:
         'font-family': 'Arial, sans-serif'
     })
 
-    @app.callback(
-        [Output('box-plot', 'figure'),
-         Output('industry-group-bar-plot', 'figure')],
-        Input('variable-dropdown', 'value')
+    # The company counts do not depend on the selected variable, so build the bar plot once;
+    # rows are presorted by group, so the counts come out in display order without sorting
+    company_counts = df_top.groupby('Primary Industry Group', sort=False, observed=True).size()
+    bar_fig = go.Figure(go.Bar(
+        x=company_counts.index.astype(str).tolist(),
+        y=company_counts.tolist(),
+        text=company_counts.tolist(),
+        name='Company Count'
+    ))
+    bar_fig.update_layout(
+        title='Company Count per Primary Industry Group',
+        xaxis_title='Primary Industry Group',
+        yaxis_title='Company Count',
+        xaxis_tickangle=-45,
+        height=600,
+        template='plotly_white'
     )
-    def update_graphs(selected_variable):
-        # Create box plot
-        box_fig = px.box(
-            df_top, 
-            x='Primary Industry Group', 
-            y=selected_variable, 
-            title=f'Box Plot of {selected_variable} by Primary Industry Group',
-            hover_data=['Company'] if 'Company' in df_top.columns else None
-        )
+
+    @functools.lru_cache(maxsize=len(columns_to_convert))
+    def _build_box(selected_variable):
+        """Build the box plot for ``selected_variable``, memoized per variable."""
+        if selected_variable not in columns_to_convert or box_stats.empty:
+            # Cleared dropdown or no grouped rows: show empty axes rather than failing the callback
+            return go.Figure().update_layout(
+                xaxis_title='Primary Industry Group',
+                height=600,
+                template='plotly_white'
+            ).to_dict()
+
+        # Draw the boxes from precomputed statistics instead of sending every point
+        stats = box_stats.xs(selected_variable, level='variable').dropna(subset=['median'])
+        box_fig = go.Figure(go.Box(
+            x=stats.index.astype(str).tolist(),
+            q1=stats['q1'].tolist(),
+            median=stats['median'].tolist(),
+            q3=stats['q3'].tolist(),
+            lowerfence=stats['lowerfence'].tolist(),
+            upperfence=stats['upperfence'].tolist(),
+            mean=stats['mean'].tolist(),
+            boxmean=True,
+            name=selected_variable
+        ))
+        outliers = box_outliers[box_outliers['variable'] == selected_variable]
+        box_fig.add_trace(go.Scatter(
+            x=outliers['Primary Industry Group'].astype(str).tolist(),
+            y=outliers['value'].tolist(),
+            text=outliers['Company'].tolist(),
+            mode='markers',
+            marker={'color': '#636efa'},
+            name='Outliers',
+            hovertemplate='%{text}<br>%{y}<extra></extra>'
+        ))
         box_fig.update_layout(
+            showlegend=False,
+            title=f'Box Plot of {selected_variable} by Primary Industry Group',
             xaxis_title='Primary Industry Group', 
             yaxis_title=selected_variable, 
             xaxis_tickangle=-45,
             height=600,
             template='plotly_white'
         )
+        return box_fig.to_dict()
 
-        # Create bar plot
-        bar_fig = px.bar(
-            df_top.groupby('Primary Industry Group').size().reset_index(name='Company Count'),
-            x='Primary Industry Group',
-            y='Company Count',
-            title='Company Count per Primary Industry Group',
-            text='Company Count'
-        )
-        bar_fig.update_layout(
-            xaxis_title='Primary Industry Group',
-            yaxis_title='Company Count',
-            xaxis_tickangle=-45,
-            height=600,
-            template='plotly_white'
-        )
+    @app.callback(
+        [Output('box-plot', 'figure'),
+         Output('industry-group-bar-plot', 'figure')],
+        Input('variable-dropdown', 'value')
+    )
+    def update_graphs(selected_variable):
+        return _build_box(selected_variable), bar_fig
 
-        return box_fig, bar_fig
+    @app.callback(
+        [Output('data-table', 'data'),
+         Output('data-table', 'page_count')],
+        Input('data-table', 'page_current'),
+        Input('data-table', 'page_size'),
+        Input('data-table', 'sort_by'),
+        Input('data-table', 'filter_query')
+    )
+    def update_data_table(page_current, page_size, sort_by, filter_query):
+        # Filter, sort and page on the server so only the visible rows are sent
+        dff = filter_data(df_top, filter_query)
+
+        if sort_by:
+            dff = dff.sort_values(
+                [col['column_id'] for col in sort_by],
+                ascending=[col['direction'] == 'asc' for col in sort_by]
+            )
+
+        page_count = max(1, -(-len(dff) // page_size))
+        start = page_current * page_size
+        return to_records(dff.iloc[start:start + page_size][DISPLAY_COLS]), page_count
+
+    # The statistics never change after startup, so serialize the download once
+    csv_buffer = io.BytesIO()
+    pa.csv.write_csv(grouped_table, csv_buffer)
+    csv_bytes = csv_buffer.getvalue()
 
     @app.callback(
         Output("download-csv", "data"),
@@ -274,11 +650,19 @@ try:
         prevent_initial_call=True
     )
     def download_csv(n_clicks):
-        return dcc.send_data_frame(grouped.reset_index().to_csv, "descriptive_statistics.csv")
+        return dcc.send_bytes(csv_bytes, "descriptive_statistics.csv")
+
+    return app
 
-    if __name__ == '__main__':
-        app.run_server(debug=True)
 
+try:
+    app = create_app()
 except Exception as e:
     logger.error("Unhandled exception during application startup", exc_info=True)
     raise
+
+# For web deployment
+server = app.server
+
+if __name__ == '__main__':
+    app.run_server(debug=True)